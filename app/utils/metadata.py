@@ -1744,8 +1744,13 @@ class ModParser(QRunnable):
         invalid_about_file_path_found = True
         about_folder_name = "About"
         about_file_name = "About.xml"
+        # List the mod folder and its "About" folder once; the case-insensitive
+        # lookups below all reuse these listings instead of re-scanning
+        with os.scandir(mod_directory) as entries:
+            mod_directory_entries = list(entries)
+        about_folder_entries: list[os.DirEntry[str]] = []
         # Look for a case-insensitive "About" folder
-        for temp_file in os.scandir(mod_directory):
+        for temp_file in mod_directory_entries:
             if (
                 temp_file.name.lower() == about_folder_name.lower()
                 and temp_file.is_dir()
@@ -1755,7 +1760,9 @@ class ModParser(QRunnable):
                 break
             # Look for a case-insensitive "About.xml" file
         if not invalid_about_folder_path_found:
-            for temp_file in os.scandir(str((directory_path / about_folder_name))):
+            with os.scandir(str((directory_path / about_folder_name))) as entries:
+                about_folder_entries = list(entries)
+            for temp_file in about_folder_entries:
                 if (
                     temp_file.name.lower() == about_file_name.lower()
                     and temp_file.is_file()
@@ -1765,7 +1772,7 @@ class ModParser(QRunnable):
                     break
         # Look for .rsc scenario files to load metadata from if we didn't find About.xml
         if invalid_about_file_path_found:
-            for temp_file in os.scandir(mod_directory):
+            for temp_file in mod_directory_entries:
                 if temp_file.name.lower().endswith(".rsc") and not temp_file.is_dir():
                     scenario_rsc_file = temp_file.name
                     scenario_rsc_found = True
@@ -1779,7 +1786,7 @@ class ModParser(QRunnable):
         # Look for a case-insensitive "PublishedFileId.txt" file if we didn't find a pfid
         elif not pfid and not invalid_about_folder_path_found:
             pfid_file_name = "PublishedFileId.txt"
-            for temp_file in os.scandir(str((directory_path / about_folder_name))):
+            for temp_file in about_folder_entries:
                 if (
                     temp_file.name.lower() == pfid_file_name.lower()
                     and temp_file.is_file()